@@ -0,0 +1,103 @@
+"""
+Numba-compiled kernels for the resampling (batch) code paths and the
+pairwise post-hoc statistics with many groups.
+
+numba is an optional dependency.  Importing this module raises
+``ImportError`` when it is not installed, and callers fall back to their
+pure-NumPy implementations.  Nothing here is imported by the GUI at
+start-up.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+# Re-association lets the reductions vectorize; NaN/inf semantics are kept
+# so a zero within-group variance still yields F = inf.
+_FASTMATH = {"reassoc", "contract", "arcp"}
+
+
+@njit(parallel=True, fastmath=_FASTMATH, cache=True)
+def one_way_batch_f(Y, codes, nj, k):
+    """
+    One-way F-statistic for every row of ``Y`` (shape ``(B, N)``).
+
+    ``codes`` gives the group (0..k-1) of each column and ``nj`` the size
+    of each group.  Rows are processed in parallel.
+    """
+    n_samples, n_total = Y.shape
+    df_between = k - 1
+    df_within = n_total - k
+    out = np.empty(n_samples)
+
+    for s in prange(n_samples):
+        row = Y[s]
+        means = np.zeros(k)
+        total = 0.0
+        for i in range(n_total):
+            means[codes[i]] += row[i]
+            total += row[i]
+        grand_mean = total / n_total
+
+        ss_between = 0.0
+        for j in range(k):
+            means[j] /= nj[j]
+            d = means[j] - grand_mean
+            ss_between += nj[j] * d * d
+
+        ss_within = 0.0
+        for i in range(n_total):
+            d = row[i] - means[codes[i]]
+            ss_within += d * d
+
+        ms_within = ss_within / df_within if df_within > 0 else 0.0
+        if ms_within > 0:
+            out[s] = (ss_between / df_between) / ms_within
+        else:
+            out[s] = np.inf
+    return out
+
+
+# Post-hoc kernels use NumPy's error model so a zero df or variance gives
+# inf/nan like the vectorised fallback instead of raising.
+@njit(parallel=True, fastmath=_FASTMATH, error_model="numpy", cache=True)
+def pairwise_t(means, ss, ns, i_idx, j_idx):
+    """
+    Mean difference, pooled-variance t and df for each pair (i_idx, j_idx).
+
+    ``ss`` holds each group's sum of squared deviations from its mean and
+    ``ns`` the group sizes as floats.  Pairs are processed in parallel.
+    """
+    m = i_idx.size
+    diffs = np.empty(m)
+    t = np.empty(m)
+    df = np.empty(m)
+    for p in prange(m):
+        i = i_idx[p]
+        j = j_idx[p]
+        d = ns[i] + ns[j] - 2.0
+        sp2 = (ss[i] + ss[j]) / d
+        diff = means[i] - means[j]
+        diffs[p] = diff
+        t[p] = diff / np.sqrt(sp2 * (1.0 / ns[i] + 1.0 / ns[j]))
+        df[p] = d
+    return diffs, t, df
+
+
+@njit(parallel=True, fastmath=_FASTMATH, error_model="numpy", cache=True)
+def pairwise_scheffe_f(means, ns, i_idx, j_idx, scale):
+    """
+    Mean difference and Scheffé F for each pair (i_idx, j_idx).
+
+    ``scale`` is (k - 1) * MS_within; a non-positive denominator gives F = 0.
+    """
+    m = i_idx.size
+    diffs = np.empty(m)
+    f = np.empty(m)
+    for p in prange(m):
+        i = i_idx[p]
+        j = j_idx[p]
+        diff = means[i] - means[j]
+        denom = scale * (1.0 / ns[i] + 1.0 / ns[j])
+        diffs[p] = diff
+        f[p] = diff * diff / denom if denom > 0 else 0.0
+    return diffs, f
@@ -9,27 +9,26 @@ Both tabs include: Calculate, Post-Hoc, Visualize, Reset, Save CSV.
 
 import sys
 import os
+import io
+import csv
+
 import numpy as np
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QGridLayout, QTabWidget, QTableWidget, QTableWidgetItem,
+    QGridLayout, QTabWidget, QTableView,
     QPushButton, QLabel, QTextEdit, QMessageBox, QSpinBox,
     QLineEdit, QFileDialog, QGroupBox, QScrollArea, QSplitter,
     QSizePolicy, QDialog, QFrame,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QFont
 
-import matplotlib
-matplotlib.use("QtAgg")
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-
+# SciPy and Matplotlib are imported inside the handlers that need them
+# (post_hoc, visualizations, the figure canvas) so the window can appear
+# before those packages are loaded.
 from one_way_logic import OneWayANOVA
 from two_way_logic import TwoWayANOVA
-from post_hoc import tukey_hsd, bonferroni, scheffe
-from visualizations import box_plot, bar_chart_with_error, interaction_plot, residual_plots
 
 
 # ======================================================================
@@ -42,15 +41,182 @@ BTN_RED = "background-color: #f44336; color: white; font-weight: bold; padding:
 BTN_GRAY = "background-color: #607D8B; color: white; font-weight: bold; padding: 6px 14px;"
 MONO_FONT = "font-family: Consolas, 'Courier New', monospace; font-size: 12px;"
 
+# Grids at least this large are parsed with pandas' C CSV reader when
+# pandas is installed; below it the TSV round trip costs more than it saves.
+_PANDAS_MIN_CELLS = 10_000
+
+
+# ======================================================================
+# Table helpers
+# ======================================================================
+class ArrayTableModel(QAbstractTableModel):
+    """
+    Editable table model backed by a ``(rows, cols)`` ndarray of cell text.
+
+    The tabs read the whole grid at once through :attr:`cells` instead of
+    visiting one cell at a time, and reshaping or clearing the grid emits a
+    single model signal.
+    """
+
+    def __init__(self, rows=0, cols=0, col_labels=None, row_labels=None,
+                 parent=None):
+        super().__init__(parent)
+        self._data = np.full((rows, cols), "", dtype=object)
+        self._col_labels = list(col_labels or [])
+        self._row_labels = list(row_labels or [])
+
+    @property
+    def cells(self):
+        """The ``(rows, cols)`` object array of cell strings (not a copy)."""
+        return self._data
+
+    # ── Qt model interface ──
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._data.shape[0]
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._data.shape[1]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role in (Qt.DisplayRole, Qt.EditRole):
+            return self._data[index.row(), index.column()]
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        self._data[index.row(), index.column()] = "" if value is None else str(value)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def flags(self, index):
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        labels = (self._col_labels if orientation == Qt.Horizontal
+                  else self._row_labels)
+        return labels[section] if section < len(labels) else str(section + 1)
+
+    # ── Bulk operations ──
+    def reset(self, rows, cols, col_labels=None, row_labels=None):
+        """Replace the grid with an empty ``rows x cols`` one."""
+        self.beginResetModel()
+        self._data = np.full((rows, cols), "", dtype=object)
+        self._col_labels = list(col_labels or [])
+        self._row_labels = list(row_labels or [])
+        self.endResetModel()
+
+    def clear(self):
+        """Blank every cell, keeping the shape and headers."""
+        rows, cols = self._data.shape
+        if rows and cols:
+            self._data[...] = ""
+            self.dataChanged.emit(self.index(0, 0), self.index(rows - 1, cols - 1))
+
+    def append_row(self):
+        rows, cols = self._data.shape
+        self.beginInsertRows(QModelIndex(), rows, rows)
+        self._data = np.vstack([self._data, np.full((1, cols), "", dtype=object)])
+        self.endInsertRows()
+
+    def remove_last_row(self):
+        rows = self._data.shape[0]
+        if rows <= 1:
+            return
+        self.beginRemoveRows(QModelIndex(), rows - 1, rows - 1)
+        self._data = self._data[:-1].copy()
+        self.endRemoveRows()
+
+    def column_label(self, col):
+        return self.headerData(col, Qt.Horizontal)
+
+
+def _parse_with_pandas(cells):
+    """
+    Parse a grid of cell text with pandas' C CSV engine.
+
+    Returns the float64 array, or ``None`` when pandas is not installed or
+    the text is anything but plain numbers and blanks; the caller then uses
+    the NumPy path, which also reports the offending cell.
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        return None
+
+    tsv = "\n".join("\t".join(row) for row in cells)
+    try:
+        frame = pd.read_csv(
+            io.StringIO(tsv), sep="\t", header=None, dtype=np.float64,
+            na_values=[""], keep_default_na=False, quoting=csv.QUOTE_NONE,
+            skip_blank_lines=False, engine="c",
+        )
+    except ValueError:
+        return None
+    values = frame.to_numpy()
+    return values if values.shape == cells.shape else None
+
+
+def _parse_cells(cells):
+    """
+    Convert an array of cell text to floats in one vectorized pass.
+
+    Surrounding whitespace is ignored and blank cells are allowed.
+
+    Returns:
+        (values, filled) — a float64 array with NaN for blank cells and a
+        boolean mask of the non-blank cells.
+
+    Raises:
+        ValueError naming the first cell that is not a number.
+    """
+    cells = np.asarray(cells)
+    values = None
+    if cells.size >= _PANDAS_MIN_CELLS:
+        values = _parse_with_pandas(cells)
+    if values is None:
+        values = _parse_with_numpy(cells)
+    # A literal "nan" counts as blank, the same on both paths
+    return values, ~np.isnan(values)
+
+
+def _parse_with_numpy(cells):
+    """NumPy fallback for :func:`_parse_cells`; raises on invalid cells."""
+    cells = np.char.strip(cells.astype(str))
+    filled = cells != ""
+    try:
+        return np.where(filled, cells, "nan").astype(np.float64)
+    except ValueError:
+        # Slow path only to locate the offending cell for the message
+        for row, col in np.argwhere(filled):
+            text = cells[row, col]
+            try:
+                float(text)
+            except ValueError:
+                raise ValueError(
+                    f"Invalid number at Row {row + 1}, "
+                    f"Column {col + 1}: '{text}'"
+                ) from None
+        raise
+
 
 # ======================================================================
 # Visualization Popup Dialog
 # ======================================================================
 class VisualizationDialog(QDialog):
-    """Resizable popup window that displays matplotlib figures in a scroll area."""
+    """
+    Resizable popup window that displays matplotlib figures in a scroll area.
+
+    The dialog keeps its figures and canvases so a later Visualize can redraw
+    into the same ``Figure`` objects and call :meth:`refresh`.
+    """
 
     def __init__(self, figures, title="ANOVA — Visualizations", parent=None):
         super().__init__(parent)
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+
         self.setWindowTitle(title)
         self.resize(900, 700)
         self.setMinimumSize(600, 400)
@@ -64,24 +230,68 @@ class VisualizationDialog(QDialog):
         container_layout = QVBoxLayout(container)
         container_layout.setSpacing(20)
 
-        for fig in figures:
+        self.figures = list(figures)
+        self.canvases = []
+        for fig in self.figures:
             canvas = FigureCanvas(fig)
             canvas.setMinimumHeight(400)
+            # Schedule a single render for the first paint instead of
+            # drawing eagerly and again when the widget is shown.
+            canvas.draw_idle()
             container_layout.addWidget(canvas)
+            self.canvases.append(canvas)
 
         container_layout.addStretch()
         scroll.setWidget(container)
         layout.addWidget(scroll)
 
+    def refresh(self):
+        """Redraw every canvas after its figure has been re-plotted."""
+        for canvas in self.canvases:
+            canvas.draw_idle()
+
+
+# ======================================================================
+# Shared visualization handling for both tabs
+# ======================================================================
+class _VisualizeMixin:
+    """
+    Builds a tab's figures and shows them in a :class:`VisualizationDialog`
+    that is reused across clicks.
+
+    Figures are built on the GUI thread: matplotlib's text rendering is not
+    thread-safe, and pooled figures are attached to live canvases.  The tab
+    must provide ``_viz_dialog``.
+    """
+
+    def _figure_pool(self, n):
+        """Figures of the open dialog to redraw into, or ``None`` slots."""
+        if self._viz_dialog is not None:
+            return self._viz_dialog.figures
+        return [None] * n
+
+    def _show_viz(self, figs, title):
+        if self._viz_dialog is None:
+            self._viz_dialog = VisualizationDialog(figs, title=title, parent=self)
+        else:
+            self._viz_dialog.refresh()
+        self._viz_dialog.show()
+        self._viz_dialog.raise_()
+
+    def _close_viz(self):
+        if self._viz_dialog is not None:
+            self._viz_dialog.close()
+            self._viz_dialog = None
+
 
 # ======================================================================
 # One-Way Tab
 # ======================================================================
-class OneWayTab(QWidget):
+class OneWayTab(_VisualizeMixin, QWidget):
     def __init__(self):
         super().__init__()
         self._last_results = None
-        self._last_csv = None
+        self._anova = None
         self._init_ui()
 
     def _init_ui(self):
@@ -157,26 +367,28 @@ class OneWayTab(QWidget):
         layout.addWidget(action_group)
 
         # ── Data table ──
-        self.table = QTableWidget(10, 3)
-        self.table.setHorizontalHeaderLabels(["Group 1", "Group 2", "Group 3"])
+        self.table_model = ArrayTableModel(
+            10, 3, col_labels=["Group 1", "Group 2", "Group 3"]
+        )
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
         layout.addWidget(self.table, stretch=1)
 
         # ── Row buttons ──
         row_btn_layout = QHBoxLayout()
         add_row_btn = QPushButton("Add Row")
-        add_row_btn.clicked.connect(lambda: self.table.insertRow(self.table.rowCount()))
+        add_row_btn.clicked.connect(self.table_model.append_row)
         row_btn_layout.addWidget(add_row_btn)
 
         rem_row_btn = QPushButton("Remove Row")
-        rem_row_btn.clicked.connect(
-            lambda: self.table.removeRow(self.table.rowCount() - 1) if self.table.rowCount() > 1 else None
-        )
+        rem_row_btn.clicked.connect(self.table_model.remove_last_row)
         row_btn_layout.addWidget(rem_row_btn)
         layout.addLayout(row_btn_layout)
 
         # ── Results area ──
         self.results_text = QTextEdit()
         self.results_text.setReadOnly(True)
+        self.results_text.setAcceptRichText(False)
         self.results_text.setPlaceholderText("Results will appear here ...")
         self.results_text.setStyleSheet(MONO_FONT)
         self.results_text.setMaximumHeight(200)
@@ -188,32 +400,18 @@ class OneWayTab(QWidget):
         n_rows = self.num_rows_spin.value()
         names = self._parse_group_names(n_groups)
 
-        self.table.setColumnCount(n_groups)
-        self.table.setRowCount(n_rows)
-        self.table.setHorizontalHeaderLabels(names)
-        self.table.clearContents()
+        self.table_model.reset(n_rows, n_groups, col_labels=names)
 
     # ── Extract data ──
     def _extract_data(self):
+        values, filled = _parse_cells(self.table_model.cells)
         data = []
-        n_groups = self.table.columnCount()
         names = []
-        for col in range(n_groups):
-            group = []
-            for row in range(self.table.rowCount()):
-                item = self.table.item(row, col)
-                if item and item.text().strip():
-                    try:
-                        group.append(float(item.text()))
-                    except ValueError:
-                        raise ValueError(
-                            f"Invalid number at Row {row + 1}, "
-                            f"Column {col + 1}: '{item.text()}'"
-                        )
-            if group:
-                data.append(group)
-                header = self.table.horizontalHeaderItem(col)
-                names.append(header.text() if header else f"Group {col + 1}")
+        for col in range(values.shape[1]):
+            column = filled[:, col]
+            if column.any():
+                data.append(values[column, col])
+                names.append(self.table_model.column_label(col))
         return data, names
 
     # ── Calculate ──
@@ -225,10 +423,9 @@ class OneWayTab(QWidget):
                                     "Provide at least 2 groups with data.")
                 return
 
-            anova = OneWayANOVA(data, group_names=names)
-            self._last_results = anova.calculate()
-            self._last_csv = anova.to_csv_string()
-            self.results_text.setText(self._last_results["summary"])
+            self._anova = OneWayANOVA(data, group_names=names)
+            self._last_results = self._anova.calculate()
+            self.results_text.setPlainText(self._last_results["summary"])
             self.posthoc_btn.setEnabled(True)
             self.viz_btn.setEnabled(True)
         except Exception as e:
@@ -239,6 +436,8 @@ class OneWayTab(QWidget):
         if not self._last_results:
             return
         try:
+            from post_hoc import tukey_hsd, bonferroni, scheffe
+
             data, names = self._extract_data()
             groups = [np.array(g) for g in data]
 
@@ -255,7 +454,7 @@ class OneWayTab(QWidget):
                 + "\n\n" + bonf["summary"]
                 + "\n\n" + sch["summary"]
             )
-            self.results_text.setText(combined)
+            self.results_text.setPlainText(combined)
         except Exception as e:
             QMessageBox.critical(self, "Post-Hoc Error", str(e))
 
@@ -263,28 +462,27 @@ class OneWayTab(QWidget):
     def visualize(self):
         if not self._last_results:
             return
-        self._close_viz()
         try:
+            from visualizations import box_plot, bar_chart_with_error, residual_plots
+
             r = self._last_results
             data, _ = self._extract_data()
             groups = [np.array(g) for g in data]
+            pool = self._figure_pool(3)
 
             figs = [
-                box_plot(groups, r["group_names"]),
+                box_plot(groups, r["group_names"], fig=pool[0]),
                 bar_chart_with_error(r["group_means"], r["group_se"],
-                                     r["group_names"]),
-                residual_plots(r["residuals"]),
+                                     r["group_names"], fig=pool[1]),
+                residual_plots(r["residuals"], fig=pool[2]),
             ]
-            self._viz_dialog = VisualizationDialog(
-                figs, title="One-Way ANOVA — Visualizations", parent=self
-            )
-            self._viz_dialog.show()
+            self._show_viz(figs, "One-Way ANOVA — Visualizations")
         except Exception as e:
             QMessageBox.critical(self, "Visualization Error", str(e))
 
     # ── Save ──
     def save_results(self):
-        if not self._last_csv:
+        if not self._last_results:
             QMessageBox.information(self, "Nothing to Save",
                                     "Run a calculation first.")
             return
@@ -293,26 +491,22 @@ class OneWayTab(QWidget):
             "CSV Files (*.csv);;All Files (*)"
         )
         if path:
-            with open(path, "w", newline="") as f:
-                f.write(self._last_csv)
+            # write_csv() reuses the cached calculate() results
+            with open(path, "w", newline="", buffering=1 << 20) as f:
+                self._anova.write_csv(f)
             QMessageBox.information(self, "Saved", f"Results saved to:\n{path}")
 
     # ── Reset ──
     def reset_all(self):
-        self.table.clearContents()
+        self.table_model.clear()
         self.results_text.clear()
         self._last_results = None
-        self._last_csv = None
+        self._anova = None
         self.posthoc_btn.setEnabled(False)
         self.viz_btn.setEnabled(False)
         self._close_viz()
 
     # ── Helpers ──
-    def _close_viz(self):
-        if self._viz_dialog is not None:
-            self._viz_dialog.close()
-            self._viz_dialog = None
-
     def _parse_group_names(self, n):
         raw = self.group_names_edit.text().strip()
         if raw:
@@ -325,11 +519,11 @@ class OneWayTab(QWidget):
 # ======================================================================
 # Two-Way Tab
 # ======================================================================
-class TwoWayTab(QWidget):
+class TwoWayTab(_VisualizeMixin, QWidget):
     def __init__(self):
         super().__init__()
         self._last_results = None
-        self._last_csv = None
+        self._anova = None
         self._init_ui()
 
     def _init_ui(self):
@@ -414,12 +608,15 @@ class TwoWayTab(QWidget):
         layout.addWidget(action_group)
 
         # ── Data table ──
-        self.table = QTableWidget()
+        self.table_model = ArrayTableModel()
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
         layout.addWidget(self.table, stretch=1)
 
         # ── Results ──
         self.results_text = QTextEdit()
         self.results_text.setReadOnly(True)
+        self.results_text.setAcceptRichText(False)
         self.results_text.setPlaceholderText("Results will appear here ...")
         self.results_text.setStyleSheet(MONO_FONT)
         self.results_text.setMaximumHeight(220)
@@ -439,20 +636,17 @@ class TwoWayTab(QWidget):
         total_rows = a * r
         total_cols = b
 
-        self.table.setRowCount(total_rows)
-        self.table.setColumnCount(total_cols)
-
         # Column headers: Factor B levels
         headers_col = [f"{fb} {j + 1}" for j in range(b)]
-        self.table.setHorizontalHeaderLabels(headers_col)
 
         # Row headers: Factor A levels with replicate indices
         headers_row = []
         for i in range(a):
             for k in range(r):
                 headers_row.append(f"{fa} {i + 1} [r{k + 1}]")
-        self.table.setVerticalHeaderLabels(headers_row)
-        self.table.clearContents()
+
+        self.table_model.reset(total_rows, total_cols,
+                               col_labels=headers_col, row_labels=headers_row)
 
     # ── Extract data ──
     def _extract_data(self):
@@ -460,30 +654,22 @@ class TwoWayTab(QWidget):
         b = self.levels_b_spin.value()
         r = self.reps_spin.value()
 
-        data = []
-        for i in range(a):
-            row_data = []
-            for j in range(b):
-                cell_reps = []
-                for k in range(r):
-                    table_row = i * r + k
-                    item = self.table.item(table_row, j)
-                    if item and item.text().strip():
-                        try:
-                            cell_reps.append(float(item.text()))
-                        except ValueError:
-                            raise ValueError(
-                                f"Invalid number at row {table_row + 1}, "
-                                f"column {j + 1}: '{item.text()}'"
-                            )
-                    else:
-                        raise ValueError(
-                            f"Empty cell at row {table_row + 1}, "
-                            f"column {j + 1}. All cells must be filled."
-                        )
-                row_data.append(cell_reps)
-            data.append(row_data)
-        return data
+        cells = self.table_model.cells
+        if cells.shape[0] < a * r or cells.shape[1] < b:
+            raise ValueError(
+                "Table does not match the configured design. "
+                "Click 'Generate Table' first."
+            )
+        values, filled = _parse_cells(cells[:a * r, :b])
+        empty = np.argwhere(~filled)
+        if empty.size:
+            row, col = empty[0]
+            raise ValueError(
+                f"Empty cell at row {row + 1}, "
+                f"column {col + 1}. All cells must be filled."
+            )
+        # Table row i * r + k, column j holds replicate k of cell (i, j)
+        return np.ascontiguousarray(values.reshape(a, r, b).transpose(0, 2, 1))
 
     # ── Calculate ──
     def calculate_anova(self):
@@ -492,10 +678,9 @@ class TwoWayTab(QWidget):
             fa = self.factor_a_edit.text().strip() or "Factor A"
             fb = self.factor_b_edit.text().strip() or "Factor B"
 
-            anova = TwoWayANOVA(data, factor_a_name=fa, factor_b_name=fb)
-            self._last_results = anova.calculate()
-            self._last_csv = anova.to_csv_string()
-            self.results_text.setText(self._last_results["summary"])
+            self._anova = TwoWayANOVA(data, factor_a_name=fa, factor_b_name=fb)
+            self._last_results = self._anova.calculate()
+            self.results_text.setPlainText(self._last_results["summary"])
             self.posthoc_btn.setEnabled(True)
             self.viz_btn.setEnabled(True)
         except Exception as e:
@@ -506,6 +691,8 @@ class TwoWayTab(QWidget):
         if not self._last_results:
             return
         try:
+            from post_hoc import tukey_hsd, bonferroni, scheffe
+
             r = self._last_results
             ms_e = r["MS"]["error"]
             df_e = r["df"]["error"]
@@ -546,7 +733,7 @@ class TwoWayTab(QWidget):
                     "post-hoc skipped."
                 )
 
-            self.results_text.setText("\n".join(sections))
+            self.results_text.setPlainText("\n".join(sections))
         except Exception as e:
             QMessageBox.critical(self, "Post-Hoc Error", str(e))
 
@@ -554,47 +741,48 @@ class TwoWayTab(QWidget):
     def visualize(self):
         if not self._last_results:
             return
-        self._close_viz()
         try:
+            from visualizations import (
+                box_plot, bar_chart_with_error, interaction_plot, residual_plots,
+            )
+
             r = self._last_results
             fa = self.factor_a_edit.text().strip() or "Factor A"
             fb = self.factor_b_edit.text().strip() or "Factor B"
+            pool = self._figure_pool(6)
 
             figs = [
                 # Box plots per Factor A
                 box_plot(r["groups_by_a"], r["a_names"],
-                         title=f"Box Plot by {fa}"),
+                         title=f"Box Plot by {fa}", fig=pool[0]),
                 # Bar chart per Factor A
                 bar_chart_with_error(
                     r["row_means"], r["se_a"], r["a_names"],
-                    title=f"{fa} Means ± SE"
+                    title=f"{fa} Means ± SE", fig=pool[1]
                 ),
                 # Box plots per Factor B
                 box_plot(r["groups_by_b"], r["b_names"],
-                         title=f"Box Plot by {fb}"),
+                         title=f"Box Plot by {fb}", fig=pool[2]),
                 # Bar chart per Factor B
                 bar_chart_with_error(
                     r["col_means"], r["se_b"], r["b_names"],
-                    title=f"{fb} Means ± SE"
+                    title=f"{fb} Means ± SE", fig=pool[3]
                 ),
                 # Interaction plot
                 interaction_plot(
                     r["cell_means"], r["a_names"], r["b_names"],
-                    factor_a_label=fa, factor_b_label=fb
+                    factor_a_label=fa, factor_b_label=fb, fig=pool[4]
                 ),
                 # Residual diagnostics
-                residual_plots(r["residuals"]),
+                residual_plots(r["residuals"], fig=pool[5]),
             ]
-            self._viz_dialog = VisualizationDialog(
-                figs, title="Two-Way ANOVA — Visualizations", parent=self
-            )
-            self._viz_dialog.show()
+            self._show_viz(figs, "Two-Way ANOVA — Visualizations")
         except Exception as e:
             QMessageBox.critical(self, "Visualization Error", str(e))
 
     # ── Save ──
     def save_results(self):
-        if not self._last_csv:
+        if not self._last_results:
             QMessageBox.information(self, "Nothing to Save",
                                     "Run a calculation first.")
             return
@@ -603,26 +791,20 @@ class TwoWayTab(QWidget):
             "CSV Files (*.csv);;All Files (*)"
         )
         if path:
-            with open(path, "w", newline="") as f:
-                f.write(self._last_csv)
+            with open(path, "w", newline="", buffering=1 << 20) as f:
+                self._anova.write_csv(f)
             QMessageBox.information(self, "Saved", f"Results saved to:\n{path}")
 
     # ── Reset ──
     def reset_all(self):
-        self.table.clearContents()
+        self.table_model.clear()
         self.results_text.clear()
         self._last_results = None
-        self._last_csv = None
+        self._anova = None
         self.posthoc_btn.setEnabled(False)
         self.viz_btn.setEnabled(False)
         self._close_viz()
 
-    # ── Helpers ──
-    def _close_viz(self):
-        if self._viz_dialog is not None:
-            self._viz_dialog.close()
-            self._viz_dialog = None
-
 
 # ======================================================================
 # Main Window
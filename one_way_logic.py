@@ -1,5 +1,31 @@
+import csv
+import io
+import math
+import os
+
 import numpy as np
-from scipy import stats
+
+
+# Summary-table layout, built once at import rather than per calculate();
+# two_way_logic imports these so both tables share one format
+_SIG_THRESHOLDS = ((0.001, " ***"), (0.01, " **"), (0.05, " *"))
+_SUMMARY_HEADER = (
+    f"{'Source':<20} | {'SS':<12} | {'df':<5} | "
+    f"{'MS':<12} | {'F':<10} | {'p-value'}"
+)
+_SUMMARY_SEP = "-" * 82
+_SUMMARY_FOOTER = "\nSignificance: * p<0.05, ** p<0.01, *** p<0.001"
+
+# ANOVA_DEBUG=1 cross-checks derived quantities against direct computation
+_DEBUG = os.environ.get("ANOVA_DEBUG") == "1"
+
+
+def _sig(p):
+    """Return the significance stars for a p-value."""
+    for threshold, stars in _SIG_THRESHOLDS:
+        if p < threshold:
+            return stars
+    return ""
 
 
 class OneWayANOVA:
@@ -51,6 +77,17 @@ class OneWayANOVA:
         self.k = len(self.groups)
         self.n_total = sum(len(g) for g in self.groups)
 
+        # Flat layout: every observation in one array, groups contiguous,
+        # so the per-group sums in calculate() are single reduceat passes.
+        self._y = np.concatenate(self.groups).astype(np.float64, copy=False)
+        self._nj = np.array([len(g) for g in self.groups])
+        # Group j occupies self._y[self._offsets[j]:self._offsets[j + 1]]
+        self._offsets = np.concatenate(([0], np.cumsum(self._nj)))
+
+        # calculate() is memoised so repeated calls (e.g. CSV export) are
+        # free; the data are fixed once the object is constructed.
+        self._cache = None
+
     
     def calculate(self):
         """
@@ -58,23 +95,32 @@ class OneWayANOVA:
 
         Returns:
             dict with SS, df, MS, F, p_value, summary, group_means,
-            group_names, grand_mean, and residuals.
+            group_names, grand_mean, residuals (flat array), and
+            group_residuals (per-group views into residuals).
         """
-        group_means = [np.mean(g) for g in self.groups]
-        grand_mean = np.sum([np.sum(g) for g in self.groups]) / self.n_total
+        if self._cache is not None:
+            return self._cache
+
+        # Groups are contiguous in self._y (and never empty), so reduceat
+        # over the group start offsets walks memory sequentially
+        starts = self._offsets[:-1]
+        sum_j = np.add.reduceat(self._y, starts)
+        mean_j = sum_j / self._nj
+        grand_mean = self._y.mean()
+
+        # Residuals (for diagnostic plots)
+        resid = self._y - np.repeat(mean_j, self._nj)
 
         # Sum of Squares
-        ss_between = sum(
-            len(g) * (m - grand_mean) ** 2
-            for g, m in zip(self.groups, group_means)
-        )
-        ss_within = sum(
-            np.sum((g - m) ** 2)
-            for g, m in zip(self.groups, group_means)
-        )
-        ss_total = sum(
-            np.sum((g - grand_mean) ** 2) for g in self.groups
-        )
+        ss_between = (self._nj * (mean_j - grand_mean) ** 2).sum()
+        ss_within = resid @ resid
+        ss_total = ss_between + ss_within  # SS_total = SS_between + SS_within
+        if _DEBUG:
+            direct = ((self._y - grand_mean) ** 2).sum()
+            assert math.isclose(
+                ss_total, direct,
+                rel_tol=1e-9, abs_tol=1e-9 * float(self._y @ self._y),
+            ), f"SS_total identity violated: {ss_total!r} != {direct!r}"
 
         # Degrees of Freedom
         df_between = self.k - 1
@@ -85,22 +131,20 @@ class OneWayANOVA:
         ms_between = ss_between / df_between
         ms_within = ss_within / df_within if df_within > 0 else 0.0
 
-        # F-statistic & p-value
-        f_stat = ms_between / ms_within if ms_within > 0 else float("inf")
-        p_value = stats.f.sf(f_stat, df_between, df_within)
+        # F-statistic & p-value (fdtrc is the F survival function without
+        # the rv_continuous dispatch of stats.f.sf; imported lazily)
+        from scipy.special import fdtrc
 
-        # Residuals (for diagnostic plots)
-        residuals = np.concatenate([
-            g - m for g, m in zip(self.groups, group_means)
-        ])
+        f_stat = ms_between / ms_within if ms_within > 0 else float("inf")
+        p_value = fdtrc(df_between, df_within, f_stat)
 
-        # Standard errors per group
-        group_se = [
-            np.std(g, ddof=1) / np.sqrt(len(g)) if len(g) > 1 else 0.0
-            for g in self.groups
-        ]
+        # Standard errors per group, from the residuals already computed
+        # (single-observation groups have ss_j = 0 and therefore SE 0)
+        ss_j = np.add.reduceat(resid * resid, starts)
+        var_j = ss_j / np.maximum(self._nj - 1, 1)
+        group_se = np.sqrt(var_j / self._nj).tolist()
 
-        return {
+        results = {
             "SS": {"between": ss_between, "within": ss_within, "total": ss_total},
             "df": {"between": df_between, "within": df_within, "total": df_total},
             "MS": {"between": ms_between, "within": ms_within},
@@ -111,55 +155,128 @@ class OneWayANOVA:
                 df_between, df_within, df_total,
                 ms_between, ms_within, f_stat, p_value,
             ),
-            "group_means": group_means,
+            "group_means": mean_j.tolist(),
             "group_se": group_se,
             "group_names": list(self._group_names),
             "grand_mean": grand_mean,
-            "residuals": residuals,
+            "residuals": resid,
+            "group_residuals": [
+                resid[lo:hi]
+                for lo, hi in zip(self._offsets[:-1], self._offsets[1:])
+            ],
         }
+        self._cache = results
+        return results
 
-    def to_csv_string(self):
-        """Return the ANOVA table as a CSV-formatted string."""
+    @staticmethod
+    def calculate_batch(Y, codes):
+        """
+        F-statistics and p-values for many datasets sharing one grouping.
+
+        Intended for resampling work (bootstrap, permutation, Monte Carlo)
+        where the same design is analysed thousands of times.
+
+        Args:
+            Y: array of shape (n_samples, n_total); each row is one dataset.
+            codes: int array of length n_total giving the group (0..k-1)
+                   of every column of Y.
+
+        Returns:
+            dict with "F" and "p_value" arrays of length n_samples.
+        """
+        from scipy.special import fdtrc
+
+        Y, codes, nj = OneWayANOVA._batch_inputs(Y, codes)
+        n_samples, n_total = Y.shape
+        k = nj.size
+
+        # Offset the codes of row s by s * k so a single bincount produces
+        # every (row, group) sum at once.
+        flat_codes = (codes + k * np.arange(n_samples)[:, None]).ravel()
+        sums = np.bincount(
+            flat_codes, weights=Y.ravel(), minlength=n_samples * k
+        ).reshape(n_samples, k)
+        means = sums / nj
+        grand_mean = Y.mean(axis=1)
+
+        ss_between = (nj * (means - grand_mean[:, None]) ** 2).sum(axis=1)
+        resid = Y - means[:, codes]
+        ss_within = np.einsum("ij,ij->i", resid, resid)
+
+        df_between = k - 1
+        df_within = n_total - k
+        ms_between = ss_between / df_between
+        ms_within = ss_within / df_within if df_within > 0 else np.zeros(n_samples)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            f_stat = np.where(ms_within > 0, ms_between / ms_within, np.inf)
+        return {"F": f_stat, "p_value": fdtrc(df_between, df_within, f_stat)}
+
+    @staticmethod
+    def batch_f(Y, codes):
+        """
+        F-statistics only, for permutation tests and other resampling loops.
+
+        Takes the same arguments as :meth:`calculate_batch`.  When numba is
+        installed the rows are processed by a parallel compiled kernel;
+        otherwise this falls back to the NumPy implementation.
+
+        Returns:
+            float64 array of length n_samples.
+        """
+        try:
+            from _numba_kernels import one_way_batch_f
+        except ImportError:
+            return OneWayANOVA.calculate_batch(Y, codes)["F"]
+
+        Y, codes, nj = OneWayANOVA._batch_inputs(Y, codes)
+        return one_way_batch_f(Y, codes, nj, nj.size)
+
+    @staticmethod
+    def _batch_inputs(Y, codes):
+        """Validate batch arguments; return C-contiguous Y, codes and nj."""
+        Y = np.ascontiguousarray(np.atleast_2d(Y), dtype=np.float64)
+        codes = np.ascontiguousarray(codes, dtype=np.intp)
+        n_total = Y.shape[1]
+        if codes.shape != (n_total,):
+            raise ValueError(
+                f"codes must have length {n_total} to match the columns of Y."
+            )
+        nj = np.bincount(codes)
+        if nj.size < 2 or np.any(nj == 0):
+            raise ValueError("ANOVA requires at least 2 non-empty groups.")
+        return Y, codes, nj
+
+    def write_csv(self, fileobj):
+        """Write the ANOVA table as CSV rows to an open text file."""
         results = self.calculate()
         ss = results["SS"]
         df = results["df"]
         ms = results["MS"]
 
-        lines = ["Source,SS,df,MS,F,p-value"]
-        lines.append(
-            f"Between Groups,{ss['between']:.6f},{df['between']},"
-            f"{ms['between']:.6f},{results['F']:.6f},{results['p_value']:.6f}"
-        )
-        lines.append(
-            f"Within Groups,{ss['within']:.6f},{df['within']},"
-            f"{ms['within']:.6f},-,-"
-        )
-        lines.append(
-            f"Total,{ss['total']:.6f},{df['total']},-,-,-"
-        )
-        return "\n".join(lines)
+        writer = csv.writer(fileobj, lineterminator="\n")
+        writer.writerows((
+            ("Source", "SS", "df", "MS", "F", "p-value"),
+            ("Between Groups", f"{ss['between']:.6f}", df["between"],
+             f"{ms['between']:.6f}", f"{results['F']:.6f}",
+             f"{results['p_value']:.6f}"),
+            ("Within Groups", f"{ss['within']:.6f}", df["within"],
+             f"{ms['within']:.6f}", "-", "-"),
+            ("Total", f"{ss['total']:.6f}", df["total"], "-", "-", "-"),
+        ))
+
+    def to_csv_string(self):
+        """Return the ANOVA table as a CSV-formatted string."""
+        buf = io.StringIO()
+        self.write_csv(buf)
+        return buf.getvalue().rstrip("\n")
 
   
     def _format_summary(self, ssb, ssw, sst, dfb, dfw, dft, msb, msw, f, p):
         """Format the ANOVA table as a readable string with significance."""
-
-        def sig(pv):
-            if pv < 0.001:
-                return " ***"
-            elif pv < 0.01:
-                return " **"
-            elif pv < 0.05:
-                return " *"
-            return ""
-
-        header = (
-            f"{'Source':<20} | {'SS':<12} | {'df':<5} | "
-            f"{'MS':<12} | {'F':<10} | {'p-value'}"
-        )
-        sep = "-" * 82
         row1 = (
             f"{'Between Groups':<20} | {ssb:<12.4f} | {dfb:<5} | "
-            f"{msb:<12.4f} | {f:<10.4f} | {p:.6f}{sig(p)}"
+            f"{msb:<12.4f} | {f:<10.4f} | {p:.6f}{_sig(p)}"
         )
         row2 = (
             f"{'Within Groups':<20} | {ssw:<12.4f} | {dfw:<5} | "
@@ -169,8 +286,10 @@ class OneWayANOVA:
             f"{'Total':<20} | {sst:<12.4f} | {dft:<5} | "
             f"{'-':<12} | {'-':<10} | -"
         )
-        footer = "\nSignificance: * p<0.05, ** p<0.01, *** p<0.001"
-        return f"{header}\n{sep}\n{row1}\n{row2}\n{row3}\n{footer}"
+        return (
+            f"{_SUMMARY_HEADER}\n{_SUMMARY_SEP}\n{row1}\n{row2}\n{row3}\n"
+            f"{_SUMMARY_FOOTER}"
+        )
 
 
 if __name__ == "__main__":
@@ -7,45 +7,178 @@ their names, and returns a dict with a structured table and a formatted
 summary string.
 """
 
+from functools import lru_cache
+
 import numpy as np
 from scipy import stats
-from itertools import combinations
+
+
+# From this many groups on, the pairwise statistics use the compiled
+# kernels in _numba_kernels (if numba is installed).  Below it, importing
+# numba costs far more than the vectorised NumPy path; the GUI tabs allow
+# at most 20 groups, so they never reach it.
+_NUMBA_MIN_GROUPS = 200
+
+# Column layouts of the per-pair result records.  "i"/"j" index the two
+# groups; the remaining fields become the keys of each table row.
+_TUKEY_DTYPE = np.dtype([
+    ("i", "i4"), ("j", "i4"), ("mean_diff", "f8"), ("p_value", "f8"),
+    ("ci_low", "f8"), ("ci_high", "f8"), ("significant", "?"),
+])
+_BONFERRONI_DTYPE = np.dtype([
+    ("i", "i4"), ("j", "i4"), ("mean_diff", "f8"), ("t_stat", "f8"),
+    ("p_raw", "f8"), ("p_adjusted", "f8"), ("significant", "?"),
+])
+_SCHEFFE_DTYPE = np.dtype([
+    ("i", "i4"), ("j", "i4"), ("mean_diff", "f8"), ("F_scheffe", "f8"),
+    ("p_value", "f8"), ("significant", "?"),
+])
+
+
+def _as_numeric(g):
+    """
+    Return *g* as an ndarray without copying real-valued numeric input.
+
+    Integer and floating arrays are used as they are (the reductions
+    below accumulate in float64 regardless); anything else, e.g. bool or
+    object data, is cast to float64.
+    """
+    a = np.asarray(g)
+    return a if a.dtype.kind in "iuf" else a.astype(np.float64)
+
+
+def _numba_kernel(name, k):
+    """
+    Compiled pairwise kernel from _numba_kernels, or None.
+
+    Only used from _NUMBA_MIN_GROUPS groups up, where the number of pairs
+    makes it pay off, and only when numba is installed.
+    """
+    if k < _NUMBA_MIN_GROUPS:
+        return None
+    try:
+        import _numba_kernels
+    except ImportError:
+        return None
+    return getattr(_numba_kernels, name)
+
+
+def _pairwise_t(means, ss, ns, i_idx, j_idx):
+    """
+    Mean differences, pooled-variance t and df for each (i, j) pair.
+
+    *ss* holds each group's sum of squared deviations from its mean, so a
+    single-observation group contributes 0 (not NaN) to the pooled
+    variance, as in ``stats.ttest_ind``.
+    """
+    kernel = _numba_kernel("pairwise_t", means.size)
+    if kernel is not None:
+        return kernel(means, ss, ns.astype(np.float64), i_idx, j_idx)
+
+    df = ns[i_idx] + ns[j_idx] - 2
+    sp2 = (ss[i_idx] + ss[j_idx]) / df
+    se = np.sqrt(sp2 * (1.0 / ns[i_idx] + 1.0 / ns[j_idx]))
+    diffs = means[i_idx] - means[j_idx]
+    return diffs, diffs / se, df
+
+
+def _pairwise_scheffe_f(means, ns, i_idx, j_idx, scale):
+    """
+    Mean differences and Scheffé F for each (i, j) pair.
+
+    *scale* is (k - 1) * MS_within; pairs with a zero denominator get F = 0.
+    """
+    kernel = _numba_kernel("pairwise_scheffe_f", means.size)
+    if kernel is not None:
+        return kernel(means, ns.astype(np.float64), i_idx, j_idx, scale)
+
+    diffs = means[i_idx] - means[j_idx]
+    denom = scale * (1.0 / ns[i_idx] + 1.0 / ns[j_idx])
+    f_vals = np.zeros_like(diffs)
+    np.divide(diffs * diffs, denom, out=f_vals, where=denom > 0)
+    return diffs, f_vals
+
+
+def _pair_records(dtype, k):
+    """Empty record array with one row per pair (i < j) of k groups."""
+    i_idx, j_idx = np.triu_indices(k, 1)
+    tbl = np.empty(i_idx.size, dtype=dtype)
+    tbl["i"] = i_idx
+    tbl["j"] = j_idx
+    return tbl
+
+
+def _records_to_table(tbl, group_names):
+    """Materialise a pair record array as the list of row dicts."""
+    keys = ("group1", "group2") + tbl.dtype.names[2:]
+    return [
+        dict(zip(keys, (group_names[i], group_names[j], *rest)))
+        for i, j, *rest in tbl.tolist()
+    ]
 
 
 # ======================================================================
 # Tukey HSD
 # ======================================================================
-def tukey_hsd(groups, group_names):
+@lru_cache(maxsize=256)
+def _tukey_critical(k, df, confidence_level=0.95):
+    """Studentized-range critical value, memoised per (k, df)."""
+    return float(stats.studentized_range.ppf(confidence_level, k, df))
+
+
+def tukey_hsd(groups, group_names, fast=False):
     """
     Perform Tukey's Honestly Significant Difference test.
 
     Args:
         groups: list of array-like, one per group.
         group_names: list of str, same length as groups.
+        fast: compute the Tukey–Kramer statistics directly instead of via
+              ``stats.tukey_hsd``: one vectorised studentized-range sf
+              call for the p-values and a cached critical value for the
+              intervals.  Worth it when many responses share the same
+              number of groups and error df.
 
     Returns:
         dict with "table" (list of comparison dicts) and "summary" (str).
     """
-    arrays = [np.asarray(g, dtype=float) for g in groups]
-    result = stats.tukey_hsd(*arrays)
-
-    table = []
+    arrays = [_as_numeric(g) for g in groups]
     k = len(arrays)
-    for i in range(k):
-        for j in range(i + 1, k):
-            pval = result.pvalue[i][j]
-            diff = np.mean(arrays[i]) - np.mean(arrays[j])
-            ci = result.confidence_interval(confidence_level=0.95)
-            table.append({
-                "group1": group_names[i],
-                "group2": group_names[j],
-                "mean_diff": float(diff),
-                "p_value": float(pval),
-                "ci_low": float(ci.low[i][j]),
-                "ci_high": float(ci.high[i][j]),
-                "significant": pval < 0.05,
-            })
+    means = np.fromiter(
+        (a.mean(dtype=np.float64) for a in arrays), dtype=float, count=k
+    )
+
+    tbl = _pair_records(_TUKEY_DTYPE, k)
+    i_idx, j_idx = tbl["i"], tbl["j"]
+    tbl["mean_diff"] = means[i_idx] - means[j_idx]
+
+    if fast:
+        ns = np.array([a.size for a in arrays])
+        df = int(ns.sum()) - k
+        ss_within = sum(
+            ((a - means[i]) ** 2).sum() for i, a in enumerate(arrays)
+        )
+        ms_within = ss_within / df
+        se = np.sqrt(ms_within / 2.0 * (1.0 / ns[i_idx] + 1.0 / ns[j_idx]))
+        q = np.abs(tbl["mean_diff"]) / se
+        tbl["p_value"] = stats.studentized_range.sf(q, k, df)
+        half_width = _tukey_critical(k, df) * se
+        tbl["ci_low"] = tbl["mean_diff"] - half_width
+        tbl["ci_high"] = tbl["mean_diff"] + half_width
+    else:
+        result = stats.tukey_hsd(*arrays)
+        # The CI matrix covers every pair, so compute it once rather than
+        # once per comparison
+        ci = result.confidence_interval(confidence_level=0.95)
+        pmat = np.asarray(result.pvalue)
+        cilo = np.asarray(ci.low)
+        cihi = np.asarray(ci.high)
+        tbl["p_value"] = pmat[i_idx, j_idx]
+        tbl["ci_low"] = cilo[i_idx, j_idx]
+        tbl["ci_high"] = cihi[i_idx, j_idx]
+    tbl["significant"] = tbl["p_value"] < 0.05
 
+    table = _records_to_table(tbl, group_names)
     summary = _format_posthoc_table("Tukey HSD", table)
     return {"table": table, "summary": summary}
 
@@ -65,25 +198,35 @@ def bonferroni(groups, group_names, alpha=0.05):
     Returns:
         dict with "table" and "summary".
     """
-    arrays = [np.asarray(g, dtype=float) for g in groups]
+    arrays = [_as_numeric(g) for g in groups]
     k = len(arrays)
     m = k * (k - 1) // 2  # number of comparisons
     corrected_alpha = alpha / m
 
-    table = []
-    for i, j in combinations(range(k), 2):
-        t_stat, p_raw = stats.ttest_ind(arrays[i], arrays[j])
-        p_adj = min(p_raw * m, 1.0)  # Bonferroni-adjusted p
-        diff = float(np.mean(arrays[i]) - np.mean(arrays[j]))
-        table.append({
-            "group1": group_names[i],
-            "group2": group_names[j],
-            "mean_diff": diff,
-            "t_stat": float(t_stat),
-            "p_raw": float(p_raw),
-            "p_adjusted": float(p_adj),
-            "significant": p_adj < alpha,
-        })
+    # Pooled-variance t for every pair at once (same statistic as
+    # stats.ttest_ind with equal_var=True), with a single t.sf call
+    ns = np.array([len(a) for a in arrays])
+    means = np.fromiter(
+        (a.mean(dtype=np.float64) for a in arrays), dtype=float, count=k
+    )
+    ss = np.fromiter(
+        (((a - means[i]) ** 2).sum() for i, a in enumerate(arrays)),
+        dtype=float, count=k,
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        i_idx, j_idx = np.triu_indices(k, 1)
+        diffs, t_stats, df = _pairwise_t(means, ss, ns, i_idx, j_idx)
+        p_raws = 2.0 * stats.t.sf(np.abs(t_stats), df)
+    p_adjs = np.minimum(p_raws * m, 1.0)  # Bonferroni-adjusted p
+
+    tbl = _pair_records(_BONFERRONI_DTYPE, k)
+    tbl["mean_diff"] = diffs
+    tbl["t_stat"] = t_stats
+    tbl["p_raw"] = p_raws
+    tbl["p_adjusted"] = p_adjs
+    tbl["significant"] = p_adjs < alpha
+
+    table = _records_to_table(tbl, group_names)
 
     summary = _format_bonferroni_table(table, alpha, corrected_alpha)
     return {"table": table, "summary": summary}
@@ -107,32 +250,37 @@ def scheffe(groups, group_names, ms_within=None, df_within=None):
     Returns:
         dict with "table" and "summary".
     """
-    arrays = [np.asarray(g, dtype=float) for g in groups]
+    arrays = [_as_numeric(g) for g in groups]
     k = len(arrays)
-    ns = [len(a) for a in arrays]
-    N = sum(ns)
+    ns = np.array([len(a) for a in arrays])
+    N = int(ns.sum())
+    means = np.fromiter(
+        (a.mean(dtype=np.float64) for a in arrays), dtype=float, count=k
+    )
 
     if ms_within is None or df_within is None:
         # Compute pooled within-group MS
         df_within = N - k
-        ss_within = sum(np.sum((a - np.mean(a)) ** 2) for a in arrays)
+        ss_within = sum(
+            ((a - means[i]) ** 2).sum() for i, a in enumerate(arrays)
+        )
         ms_within = ss_within / df_within if df_within > 0 else 0.0
 
-    table = []
-    for i, j in combinations(range(k), 2):
-        diff = float(np.mean(arrays[i]) - np.mean(arrays[j]))
-        se = np.sqrt(ms_within * (1.0 / ns[i] + 1.0 / ns[j]))
-        f_val = (diff ** 2) / ((k - 1) * ms_within * (1.0 / ns[i] + 1.0 / ns[j])) if se > 0 else 0.0
-        # Scheffé critical value uses F(k-1, df_within)
-        p_val = stats.f.sf(f_val, k - 1, df_within)
-        table.append({
-            "group1": group_names[i],
-            "group2": group_names[j],
-            "mean_diff": diff,
-            "F_scheffe": float(f_val),
-            "p_value": float(p_val),
-            "significant": p_val < 0.05,
-        })
+    # All pairs at once; a zero standard error gives F = 0 as before
+    i_idx, j_idx = np.triu_indices(k, 1)
+    diffs, f_vals = _pairwise_scheffe_f(
+        means, ns, i_idx, j_idx, (k - 1) * ms_within
+    )
+    # Scheffé critical value uses F(k-1, df_within)
+    p_vals = stats.f.sf(f_vals, k - 1, df_within)
+
+    tbl = _pair_records(_SCHEFFE_DTYPE, k)
+    tbl["mean_diff"] = diffs
+    tbl["F_scheffe"] = f_vals
+    tbl["p_value"] = p_vals
+    tbl["significant"] = p_vals < 0.05
+
+    table = _records_to_table(tbl, group_names)
 
     summary = _format_scheffe_table(table)
     return {"table": table, "summary": summary}
@@ -141,6 +289,24 @@ def scheffe(groups, group_names, ms_within=None, df_within=None):
 # ======================================================================
 # Formatting helpers
 # ======================================================================
+# Per-row templates, parsed once by str.format rather than re-built as
+# f-strings for every comparison
+_SIG_LABEL = {True: "Yes *", False: "No"}
+_CI_FMT = "[{ci_low:.4f}, {ci_high:.4f}]"
+_TUKEY_ROW_FMT = (
+    "{group1} vs {group2:<20} | {mean_diff:>10.4f} | {p_value:>10.4f} | "
+    "{ci:>20} | {sig}"
+)
+_BONFERRONI_ROW_FMT = (
+    "{group1} vs {group2:<20} | {mean_diff:>10.4f} | {t_stat:>8.4f} | "
+    "{p_raw:>10.6f} | {p_adjusted:>10.6f} | {sig}"
+)
+_SCHEFFE_ROW_FMT = (
+    "{group1} vs {group2:<20} | {mean_diff:>10.4f} | {F_scheffe:>12.4f} | "
+    "{p_value:>10.4f} | {sig}"
+)
+
+
 def _format_posthoc_table(title, table):
     """Format Tukey HSD results."""
     lines = [
@@ -149,14 +315,12 @@ def _format_posthoc_table(title, table):
         f"{'95% CI':>20} | {'Sig.'}",
         "-" * 88,
     ]
-    for row in table:
-        ci = f"[{row['ci_low']:.4f}, {row['ci_high']:.4f}]"
-        sig = "Yes *" if row["significant"] else "No"
-        lines.append(
-            f"{row['group1']} vs {row['group2']:<20} | "
-            f"{row['mean_diff']:>10.4f} | {row['p_value']:>10.4f} | "
-            f"{ci:>20} | {sig}"
+    lines += [
+        _TUKEY_ROW_FMT.format(
+            ci=_CI_FMT.format(**row), sig=_SIG_LABEL[row["significant"]], **row
         )
+        for row in table
+    ]
     return "\n".join(lines)
 
 
@@ -170,13 +334,10 @@ def _format_bonferroni_table(table, alpha, corrected_alpha):
         f"{'p(raw)':>10} | {'p(adj)':>10} | {'Sig.'}",
         "-" * 95,
     ]
-    for row in table:
-        sig = "Yes *" if row["significant"] else "No"
-        lines.append(
-            f"{row['group1']} vs {row['group2']:<20} | "
-            f"{row['mean_diff']:>10.4f} | {row['t_stat']:>8.4f} | "
-            f"{row['p_raw']:>10.6f} | {row['p_adjusted']:>10.6f} | {sig}"
-        )
+    lines += [
+        _BONFERRONI_ROW_FMT.format(sig=_SIG_LABEL[row["significant"]], **row)
+        for row in table
+    ]
     return "\n".join(lines)
 
 
@@ -188,11 +349,8 @@ def _format_scheffe_table(table):
         f"{'p-value':>10} | {'Sig.'}",
         "-" * 82,
     ]
-    for row in table:
-        sig = "Yes *" if row["significant"] else "No"
-        lines.append(
-            f"{row['group1']} vs {row['group2']:<20} | "
-            f"{row['mean_diff']:>10.4f} | {row['F_scheffe']:>12.4f} | "
-            f"{row['p_value']:>10.4f} | {sig}"
-        )
+    lines += [
+        _SCHEFFE_ROW_FMT.format(sig=_SIG_LABEL[row["significant"]], **row)
+        for row in table
+    ]
     return "\n".join(lines)
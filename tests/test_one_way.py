@@ -1,11 +1,13 @@
 """Tests for OneWayANOVA logic."""
 
 import unittest
+from unittest import mock
 import numpy as np
 from scipy import stats
 
 import sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import one_way_logic
 from one_way_logic import OneWayANOVA
 
 
@@ -73,7 +75,68 @@ class TestOneWayANOVA(unittest.TestCase):
         results = OneWayANOVA(data).calculate()
         self.assertAlmostEqual(np.sum(results["residuals"]), 0.0, places=10)
 
-    # ── Test 7: too few groups rejected ──
+    # ── Test 7: flat kernel matches per-group reference ──
+    def test_unbalanced_means_and_residuals(self):
+        data = [[10, 12, 11, 13], [15, 16, 14], [20, 21, 19, 22, 20]]
+        results = OneWayANOVA(data).calculate()
+
+        expected_means = [np.mean(g) for g in data]
+        np.testing.assert_allclose(results["group_means"], expected_means)
+        expected_resid = np.concatenate(
+            [np.asarray(g) - m for g, m in zip(data, expected_means)]
+        )
+        np.testing.assert_allclose(results["residuals"], expected_resid)
+        for got, g, m in zip(results["group_residuals"], data, expected_means):
+            np.testing.assert_allclose(got, np.asarray(g) - m)
+            self.assertIs(got.base, results["residuals"])
+        self.assertAlmostEqual(
+            results["SS"]["within"], np.sum(expected_resid ** 2), places=10
+        )
+        expected_se = [np.std(g, ddof=1) / np.sqrt(len(g)) for g in data]
+        np.testing.assert_allclose(results["group_se"], expected_se)
+
+    # ── Test 8: results are cached between calls ──
+    def test_results_cached(self):
+        anova = OneWayANOVA([[1, 2, 3], [4, 5, 7]])
+        first = anova.calculate()
+        self.assertIs(anova.calculate(), first)
+        anova.to_csv_string()
+        self.assertIs(anova.calculate(), first)
+
+    # ── Test 9: SS_total matches the direct sum (and the debug check) ──
+    def test_ss_total_direct(self):
+        data = [[10, 12, 11, 13], [15, 16, 14], [20, 21, 19, 22, 20]]
+        with mock.patch.object(one_way_logic, "_DEBUG", True):
+            results = OneWayANOVA(data).calculate()
+        y = np.concatenate([np.asarray(g, dtype=float) for g in data])
+        self.assertAlmostEqual(
+            results["SS"]["total"], np.sum((y - y.mean()) ** 2), places=8
+        )
+
+    # ── Test 10: batch path matches scipy row by row ──
+    def test_calculate_batch(self):
+        rng = np.random.default_rng(0)
+        codes = np.repeat([0, 1, 2], [4, 6, 5])
+        Y = rng.normal(size=(8, codes.size)) + codes
+        batch = OneWayANOVA.calculate_batch(Y, codes)
+
+        for row, f_b, p_b in zip(Y, batch["F"], batch["p_value"]):
+            f_ref, p_ref = stats.f_oneway(*(row[codes == j] for j in range(3)))
+            self.assertAlmostEqual(f_b, f_ref, places=8)
+            self.assertAlmostEqual(p_b, p_ref, places=8)
+
+    # ── Test 11: batch_f agrees with calculate_batch ──
+    def test_batch_f(self):
+        rng = np.random.default_rng(1)
+        codes = np.repeat([0, 1, 2, 3], [3, 5, 4, 6])
+        Y = rng.normal(size=(20, codes.size)) + 0.5 * codes
+        np.testing.assert_allclose(
+            OneWayANOVA.batch_f(Y, codes),
+            OneWayANOVA.calculate_batch(Y, codes)["F"],
+            rtol=1e-10,
+        )
+
+    # ── Test 12: too few groups rejected ──
     def test_too_few_groups(self):
         with self.assertRaises(ValueError):
             OneWayANOVA([[1, 2, 3]])
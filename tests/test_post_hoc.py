@@ -1,6 +1,8 @@
 """Tests for post-hoc analysis functions."""
 
+import importlib.util
 import unittest
+from unittest import mock
 import numpy as np
 
 import sys, os
@@ -75,6 +77,80 @@ class TestPostHoc(unittest.TestCase):
         result4 = tukey_hsd(groups4, self.names + ["Very High"])
         self.assertEqual(len(result4["table"]), 6)
 
+    # ── Test 8: Bonferroni t and raw p match scipy's ttest_ind ──
+    def test_bonferroni_matches_ttest_ind(self):
+        from scipy import stats
+        rng = np.random.default_rng(3)
+        groups = [rng.normal(m, s, n)
+                  for m, s, n in [(0, 1, 8), (0.5, 2, 12), (1, 1.5, 5), (0.2, 1, 9)]]
+        groups.append(np.array([0.7]))  # single observation: zero variance
+        result = bonferroni(groups, ["A", "B", "C", "D", "E"])
+        pairs = [(i, j) for i in range(5) for j in range(i + 1, 5)]
+        self.assertEqual(len(result["table"]), len(pairs))
+        for row, (i, j) in zip(result["table"], pairs):
+            t_ref, p_ref = stats.ttest_ind(groups[i], groups[j])
+            self.assertAlmostEqual(row["t_stat"], t_ref, places=10)
+            self.assertAlmostEqual(row["p_raw"], p_ref, places=10)
+            self.assertAlmostEqual(row["p_adjusted"], min(p_ref * 10, 1.0), places=10)
+
+    # ── Test 9: fast Tukey path matches scipy's tukey_hsd ──
+    def test_tukey_fast_matches(self):
+        rng = np.random.default_rng(4)
+        groups = [rng.normal(m, 1, n) for m, n in [(0, 6), (0.8, 9), (1.5, 7), (0.3, 8)]]
+        names = ["A", "B", "C", "D"]
+        ref = tukey_hsd(groups, names)["table"]
+        fast = tukey_hsd(groups, names, fast=True)["table"]
+        for r, f in zip(ref, fast):
+            for key in ("mean_diff", "p_value", "ci_low", "ci_high"):
+                self.assertAlmostEqual(f[key], r[key], places=6)
+            self.assertEqual(f["significant"], r["significant"])
+
+    # ── Test 10: many groups ──
+    def test_many_groups(self):
+        from scipy import stats
+        rng = np.random.default_rng(6)
+        groups = [rng.normal(rng.normal(), 1, 5 + i % 7) for i in range(25)]
+        names = [f"G{i}" for i in range(25)]
+        bon = bonferroni(groups, names)["table"]
+        sch = scheffe(groups, names)["table"]
+        self.assertEqual(len(bon), 300)
+        self.assertEqual(len(sch), 300)
+        # Spot-check pairs against scipy (row order follows i < j)
+        for n, (i, j) in [(0, (0, 1)), (299, (23, 24))]:
+            t_ref, p_ref = stats.ttest_ind(groups[i], groups[j])
+            self.assertAlmostEqual(bon[n]["t_stat"], t_ref, places=10)
+            self.assertAlmostEqual(bon[n]["p_raw"], p_ref, places=10)
+            self.assertAlmostEqual(
+                sch[n]["mean_diff"], groups[i].mean() - groups[j].mean(), places=12
+            )
+
+    # ── Test 11: compiled kernels agree with the NumPy helpers ──
+    @unittest.skipUnless(importlib.util.find_spec("numba"), "numba not installed")
+    def test_numba_kernels_match_numpy(self):
+        import post_hoc
+        import _numba_kernels
+        rng = np.random.default_rng(9)
+        k = 30
+        ns = rng.integers(1, 12, size=k)   # includes single-observation groups
+        groups = [rng.normal(rng.normal(), 1, n) for n in ns]
+        means = np.array([g.mean() for g in groups])
+        ss = np.array([((g - g.mean()) ** 2).sum() for g in groups])
+        i_idx, j_idx = np.triu_indices(k, 1)
+
+        # Two size-1 groups give df = 0 (nan) on both paths, as callers expect
+        with mock.patch.object(post_hoc, "_NUMBA_MIN_GROUPS", k + 1), \
+                np.errstate(divide="ignore", invalid="ignore"):
+            ref_t = post_hoc._pairwise_t(means, ss, ns, i_idx, j_idx)
+            ref_f = post_hoc._pairwise_scheffe_f(means, ns, i_idx, j_idx, 2.5)
+        got_t = _numba_kernels.pairwise_t(
+            means, ss, ns.astype(np.float64), i_idx, j_idx
+        )
+        got_f = _numba_kernels.pairwise_scheffe_f(
+            means, ns.astype(np.float64), i_idx, j_idx, 2.5
+        )
+        for got, ref in zip(got_t + got_f, ref_t + ref_f):
+            np.testing.assert_allclose(got, ref, rtol=1e-12)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -94,6 +94,85 @@ class TestTwoWayANOVA(unittest.TestCase):
                      "residuals", "groups_by_a", "groups_by_b"]:
             self.assertIn(key, results)
 
+    # ── Test 10: ndarray input matches nested lists ──
+    def test_ndarray_input(self):
+        from_list = TwoWayANOVA(self.data_2x3).calculate()
+        from_arr = TwoWayANOVA(np.array(self.data_2x3, dtype=float)).calculate()
+        for src in ["A", "B", "AB", "error", "total"]:
+            self.assertAlmostEqual(from_arr["SS"][src], from_list["SS"][src])
+
+    # ── Test 11: write_csv quotes names containing commas ──
+    def test_write_csv_quotes_names(self):
+        import csv, io
+        anova = TwoWayANOVA(self.data_2x3, "Fert, N", "Water")
+        buf = io.StringIO()
+        anova.write_csv(buf)
+        rows = list(csv.reader(io.StringIO(buf.getvalue())))
+        self.assertEqual(rows[1][0], "Fert, N")
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(buf.getvalue().rstrip("\n"), anova.to_csv_string())
+
+    # ── Test 12: results are cached between calls ──
+    def test_results_cached(self):
+        anova = TwoWayANOVA(self.data_2x3)
+        first = anova.calculate()
+        self.assertIs(anova.calculate(), first)
+        anova.to_csv_string()
+        self.assertIs(anova.calculate(), first)
+
+    # ── Test 13: SS match the direct definitions, even far from zero ──
+    def test_ss_direct_large_offset(self):
+        rng = np.random.default_rng(5)
+        arr = rng.normal(size=(3, 4, 5)) + 1e6
+        ss = TwoWayANOVA(arr).calculate()["SS"]
+        cell = arr.mean(axis=2, keepdims=True)
+        self.assertAlmostEqual(ss["error"], ((arr - cell) ** 2).sum(), places=6)
+        self.assertAlmostEqual(ss["total"], ((arr - arr.mean()) ** 2).sum(), places=6)
+
+    # ── Test 14: unbalanced cells rejected with the offending cell ──
+    def test_unbalanced_rejected(self):
+        data = [[[1, 2], [3, 4]], [[5, 6], [7]]]
+        with self.assertRaises(ValueError) as ctx:
+            TwoWayANOVA(data)
+        self.assertIn("Cell (1,1)", str(ctx.exception))
+        with self.assertRaises(ValueError):
+            TwoWayANOVA([[1, 2], [3, 4]])
+
+    # ── Test 15: per-level standard errors match np.std ──
+    def test_level_standard_errors(self):
+        rng = np.random.default_rng(8)
+        arr = rng.normal(50, 3, size=(3, 4, 5))
+        results = TwoWayANOVA(arr).calculate()
+        se_a = arr.reshape(3, -1).std(axis=1, ddof=1) / np.sqrt(20)
+        se_b = arr.transpose(1, 0, 2).reshape(4, -1).std(axis=1, ddof=1) / np.sqrt(15)
+        np.testing.assert_allclose(results["se_a"], se_a, rtol=1e-10)
+        np.testing.assert_allclose(results["se_b"], se_b, rtol=1e-10)
+
+    # ── Test 16: include_viz=False returns only the ANOVA table ──
+    def test_table_only(self):
+        anova = TwoWayANOVA(self.data_2x3)
+        table = anova.calculate(include_viz=False)
+        self.assertNotIn("residuals", table)
+        anova.to_csv_string()
+        full = anova.calculate()
+        self.assertIn("residuals", full)
+        self.assertAlmostEqual(full["F"]["AB"], table["F"]["AB"])
+        self.assertIs(anova.calculate(include_viz=False), full)
+
+    # ── Test 17: calculate_batch matches per-dataset calculate ──
+    def test_calculate_batch(self):
+        rng = np.random.default_rng(11)
+        cube = rng.normal(size=(6, 2, 3, 4))
+        cube[2, 1] += 2.0   # give one dataset a real factor-A effect
+        batch = TwoWayANOVA.calculate_batch(cube)
+        for s in range(cube.shape[0]):
+            ref = TwoWayANOVA(cube[s]).calculate(include_viz=False)
+            for key in ("A", "B", "AB"):
+                self.assertAlmostEqual(batch["F"][key][s], ref["F"][key], places=10)
+                self.assertAlmostEqual(
+                    batch["p_value"][key][s], ref["p_value"][key], places=10
+                )
+
 
 if __name__ == "__main__":
     unittest.main()
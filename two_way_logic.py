@@ -1,5 +1,23 @@
+import csv
+import io
+
 import numpy as np
-from scipy import stats
+
+# Shared with the one-way summary so the two tables cannot drift apart
+from one_way_logic import _SUMMARY_FOOTER, _SUMMARY_HEADER, _SUMMARY_SEP, _sig
+
+
+def _f_sf_batch(f_vals, df1, df2):
+    """
+    F-distribution survival function over arrays, in a single SciPy call.
+
+    ``scipy.special.fdtrc`` is the ufunc behind ``stats.f.sf``; calling it
+    once on stacked statistics avoids the per-call dispatch overhead of
+    evaluating each F separately.  Arguments broadcast against each other.
+    """
+    from scipy.special import fdtrc  # imported lazily to keep GUI start-up fast
+
+    return fdtrc(df1, df2, f_vals)
 
 
 class TwoWayANOVA:
@@ -8,7 +26,10 @@ class TwoWayANOVA:
 
     Args:
         data: 3D structure — data[i][j] is a list of replicates for
-              level i of Factor A and level j of Factor B.
+              level i of Factor A and level j of Factor B.  May also be
+              an ndarray of shape (a, b, r); a C-contiguous float64 array
+              is used without copying.  The data are read once, at
+              construction, so mutating them afterwards is not supported.
         factor_a_name: Display name for Factor A (row factor).
         factor_b_name: Display name for Factor B (column factor).
     """
@@ -18,65 +39,119 @@ class TwoWayANOVA:
         self.factor_a_name = factor_a_name
         self.factor_b_name = factor_b_name
 
-        self.a = len(data)                # levels of Factor A
-        self.b = len(data[0])             # levels of Factor B
-        self.r = len(data[0][0])          # replicates per cell
-        self.N = self.a * self.b * self.r  # total observations
+        # One C-level conversion up front: ragged input fails here, and
+        # calculate() reuses the array instead of converting again.  C order
+        # keeps the per-cell (axis 2) reductions stride-1.
+        try:
+            self._arr = np.ascontiguousarray(data, dtype=np.float64)
+        except ValueError as exc:
+            self._ragged_error()
+            raise ValueError(f"Invalid two-way data: {exc}") from exc
 
         self._validate()
 
+        self.a, self.b, self.r = self._arr.shape  # levels of A, B; replicates
+        self.N = self._arr.size                   # total observations
+
+        # calculate() is memoised so the summary and the CSV export
+        # (write_csv / to_csv_string) share a single computation.
+        self._cached = None
+        self._cached_viz = False
+
    
     def _validate(self):
         """Validate that the data is a balanced design with r >= 2."""
-        if self.a < 2:
+        if self._arr.ndim != 3:
+            raise ValueError(
+                "Data must be 3-D: data[i][j] is the list of replicates for "
+                "level i of Factor A and level j of Factor B."
+            )
+        a, b, r = self._arr.shape
+        if a < 2:
             raise ValueError("Factor A must have at least 2 levels.")
-        if self.b < 2:
+        if b < 2:
             raise ValueError("Factor B must have at least 2 levels.")
-        if self.r < 2:
+        if r < 2:
             raise ValueError(
                 "Two-way ANOVA with replication requires at least 2 replicates "
                 "per cell."
             )
-        for i in range(self.a):
-            if len(self.data[i]) != self.b:
-                raise ValueError(
-                    f"Row {i} has {len(self.data[i])} columns, expected {self.b}. "
-                    "Design must be balanced."
-                )
-            for j in range(self.b):
-                if len(self.data[i][j]) != self.r:
+
+    def _ragged_error(self):
+        """
+        Raise a descriptive error if the nested input is unbalanced.
+
+        Only called after np.asarray has rejected the data, so the Python
+        loops run on the failure path alone.  Returns quietly when the
+        problem is something else (non-numeric values, wrong nesting).
+        """
+        try:
+            b, r = len(self.data[0]), len(self.data[0][0])
+            for i, row in enumerate(self.data):
+                if len(row) != b:
                     raise ValueError(
-                        f"Cell ({i},{j}) has {len(self.data[i][j])} replicates, "
-                        f"expected {self.r}. All cells must have equal replicates."
+                        f"Row {i} has {len(row)} columns, expected {b}. "
+                        "Design must be balanced."
                     )
+                for j, cell in enumerate(row):
+                    if len(cell) != r:
+                        raise ValueError(
+                            f"Cell ({i},{j}) has {len(cell)} replicates, "
+                            f"expected {r}. All cells must have equal "
+                            "replicates."
+                        )
+        except (TypeError, IndexError):
+            return
 
     
-    def calculate(self):
+    def calculate(self, include_viz=True):
         """
         Perform two-way ANOVA calculations.
 
+        Args:
+            include_viz: also build the extra fields used by the
+                visualizations and post-hoc tests (means, residuals,
+                per-level groups and standard errors).  Pass False when
+                only the ANOVA table is needed.
+
         Returns:
             dict with SS, df, MS, F, p-values for Factor A, Factor B,
             Interaction, Error, and Total.  Also includes formatted summary
-            and extra fields for visualizations.
+            and, if include_viz, extra fields for visualizations.
         """
-        a, b, r = self.a, self.b, self.r
-        arr = np.array(self.data, dtype=float)  # shape (a, b, r)
+        # A cached result with the extra fields also serves table-only calls
+        if self._cached is not None and (self._cached_viz or not include_viz):
+            return self._cached
 
-        # Means
-        grand_mean = arr.mean()
-        row_means = arr.mean(axis=(1, 2))          # shape (a,)
-        col_means = arr.mean(axis=(0, 2))           # shape (b,)
-        cell_means = arr.mean(axis=2)               # shape (a, b)
-
-        # Sum of Squares
+        a, b, r = self.a, self.b, self.r
+        arr = self._arr  # shape (a, b, r)
+
+        # Cell sums and sums of squares in one sweep over the data.  Each
+        # cell is shifted by its first replicate so the within-cell SS
+        # doesn't cancel catastrophically when the values sit far from 0;
+        # einsum squares and sums without a dev * dev temporary.
+        shift = arr[:, :, :1]
+        dev = arr - shift
+        cell_sum = dev.sum(axis=2)                   # shape (a, b)
+        cell_sumsq = np.einsum("ijk,ijk->ij", dev, dev)  # shape (a, b)
+
+        # Means (balanced design, so the marginals are means of cell means)
+        cell_means = shift[:, :, 0] + cell_sum / r   # shape (a, b)
+        row_means = cell_means.mean(axis=1)          # shape (a,)
+        col_means = cell_means.mean(axis=0)          # shape (b,)
+        grand_mean = row_means.mean()
+
+        # Sum of Squares.  Everything except SS_error works on the small
+        # (a, b) table; SS_total follows from SS_cells + SS_error.
         ss_a = b * r * np.sum((row_means - grand_mean) ** 2)
         ss_b = a * r * np.sum((col_means - grand_mean) ** 2)
         ss_ab = r * np.sum(
             (cell_means - row_means[:, None] - col_means[None, :] + grand_mean) ** 2
         )
-        ss_e = np.sum((arr - cell_means[:, :, None]) ** 2)
-        ss_t = np.sum((arr - grand_mean) ** 2)
+        ss_cells = r * np.sum((cell_means - grand_mean) ** 2)
+        ss_cell = cell_sumsq - cell_sum * cell_sum / r   # within each cell
+        ss_e = ss_cell.sum()
+        ss_t = ss_cells + ss_e
 
         # Degrees of Freedom
         df_a = a - 1
@@ -96,25 +171,12 @@ class TwoWayANOVA:
         f_b = ms_b / ms_e if ms_e > 0 else float("inf")
         f_ab = ms_ab / ms_e if ms_e > 0 else float("inf")
 
-        # p-values
-        p_a = stats.f.sf(f_a, df_a, df_e)
-        p_b = stats.f.sf(f_b, df_b, df_e)
-        p_ab = stats.f.sf(f_ab, df_ab, df_e)
-
-        # Residuals
-        residuals = (arr - cell_means[:, :, None]).flatten()
-
-        # Groups collapsed by Factor A and Factor B (for post-hoc)
-        groups_by_a = [arr[i, :, :].flatten() for i in range(a)]
-        groups_by_b = [arr[:, j, :].flatten() for j in range(b)]
-        a_names = [f"{self.factor_a_name} {i + 1}" for i in range(a)]
-        b_names = [f"{self.factor_b_name} {j + 1}" for j in range(b)]
-
-        # Standard errors per factor level
-        se_a = [np.std(g, ddof=1) / np.sqrt(len(g)) for g in groups_by_a]
-        se_b = [np.std(g, ddof=1) / np.sqrt(len(g)) for g in groups_by_b]
+        # p-values, all three in one call
+        p_a, p_b, p_ab = _f_sf_batch(
+            np.array([f_a, f_b, f_ab]), np.array([df_a, df_b, df_ab]), df_e
+        )
 
-        return {
+        self._cached = {
             "SS": {"A": ss_a, "B": ss_b, "AB": ss_ab, "error": ss_e, "total": ss_t},
             "df": {"A": df_a, "B": df_b, "AB": df_ab, "error": df_e, "total": df_t},
             "MS": {"A": ms_a, "B": ms_b, "AB": ms_ab, "error": ms_e},
@@ -127,7 +189,39 @@ class TwoWayANOVA:
                 f_a, f_b, f_ab,
                 p_a, p_b, p_ab,
             ),
-            # Extra fields for visualizations / post-hoc
+        }
+        self._cached_viz = include_viz
+        if not include_viz:
+            return self._cached
+
+        # Residuals (the subtraction yields a fresh C-order array, so
+        # ravel() is a view rather than a second copy)
+        residuals = (arr - cell_means[:, :, None]).ravel()
+
+        # Groups collapsed by Factor A and Factor B (for post-hoc): one
+        # row per level, handed out as row views of these 2-D blocks
+        a_blocks = arr.reshape(a, b * r)
+        b_blocks = arr.transpose(1, 0, 2).reshape(b, a * r)
+        groups_by_a = list(a_blocks)
+        groups_by_b = list(b_blocks)
+        a_names = [f"{self.factor_a_name} {i + 1}" for i in range(a)]
+        b_names = [f"{self.factor_b_name} {j + 1}" for j in range(b)]
+
+        # Standard errors per factor level, without another pass over the
+        # data: a level's SS is its cells' within-cell SS plus r times the
+        # spread of those cell means around the level mean
+        n_a, n_b = b * r, a * r
+        ss_level_a = ss_cell.sum(axis=1) + r * np.sum(
+            (cell_means - row_means[:, None]) ** 2, axis=1
+        )
+        ss_level_b = ss_cell.sum(axis=0) + r * np.sum(
+            (cell_means - col_means[None, :]) ** 2, axis=0
+        )
+        se_a = np.sqrt(ss_level_a / (n_a - 1) / n_a).tolist()
+        se_b = np.sqrt(ss_level_b / (n_b - 1) / n_b).tolist()
+
+        # Extra fields for visualizations / post-hoc
+        self._cached.update({
             "cell_means": cell_means.tolist(),
             "row_means": row_means.tolist(),
             "col_means": col_means.tolist(),
@@ -139,24 +233,96 @@ class TwoWayANOVA:
             "b_names": b_names,
             "se_a": se_a,
             "se_b": se_b,
+        })
+        return self._cached
+
+    @staticmethod
+    def calculate_batch(cube):
+        """
+        F-statistics and p-values for many balanced two-way datasets.
+
+        Intended for workloads that repeat the same design many times
+        (resampling, one ANOVA per time point, ...).  All sums of squares
+        are reduced over the trailing axes with the leading axis
+        broadcast, and the p-values come from a single SciPy call.
+
+        Args:
+            cube: array of shape (n_samples, a, b, r); cube[s] is one
+                  dataset in the layout accepted by TwoWayANOVA.
+
+        Returns:
+            dict with "F" and "p_value", each a dict of arrays of length
+            n_samples keyed "A", "B" and "AB".
+        """
+        cube = np.ascontiguousarray(cube, dtype=np.float64)
+        if cube.ndim != 4:
+            raise ValueError("cube must have shape (n_samples, a, b, r).")
+        _, a, b, r = cube.shape
+        if a < 2 or b < 2 or r < 2:
+            raise ValueError(
+                "Each dataset needs at least 2 levels per factor and "
+                "2 replicates per cell."
+            )
+
+        # Same shifted per-cell moments as calculate(), over every sample
+        shift = cube[..., :1]
+        dev = cube - shift
+        cell_sum = dev.sum(axis=3)
+        cell_sumsq = np.einsum("sijk,sijk->sij", dev, dev)
+        cell_means = shift[..., 0] + cell_sum / r          # (n, a, b)
+        row_means = cell_means.mean(axis=2)                 # (n, a)
+        col_means = cell_means.mean(axis=1)                 # (n, b)
+        grand_mean = row_means.mean(axis=1)                 # (n,)
+
+        ss_a = b * r * ((row_means - grand_mean[:, None]) ** 2).sum(axis=1)
+        ss_b = a * r * ((col_means - grand_mean[:, None]) ** 2).sum(axis=1)
+        inter = (cell_means - row_means[:, :, None] - col_means[:, None, :]
+                 + grand_mean[:, None, None])
+        ss_ab = r * (inter ** 2).sum(axis=(1, 2))
+        ss_e = (cell_sumsq - cell_sum * cell_sum / r).sum(axis=(1, 2))
+
+        df = np.array([a - 1, b - 1, (a - 1) * (b - 1)])
+        df_e = a * b * (r - 1)
+        ms = np.stack([ss_a, ss_b, ss_ab]) / df[:, None]    # (3, n)
+        ms_e = ss_e / df_e
+        with np.errstate(divide="ignore", invalid="ignore"):
+            f_stack = np.where(ms_e > 0, ms / ms_e, np.inf)
+        p_stack = _f_sf_batch(f_stack, df[:, None], df_e)
+
+        keys = ("A", "B", "AB")
+        return {
+            "F": dict(zip(keys, f_stack)),
+            "p_value": dict(zip(keys, p_stack)),
         }
 
-    def to_csv_string(self):
-        """Return the ANOVA table as a CSV-formatted string for saving."""
-        results = self.calculate()
+    def write_csv(self, fileobj):
+        """Write the ANOVA table as CSV rows to an open text file."""
+        results = self.calculate(include_viz=False)
         ss = results["SS"]
         df = results["df"]
         ms = results["MS"]
         f = results["F"]
         p = results["p_value"]
 
-        lines = ["Source,SS,df,MS,F,p-value"]
-        lines.append(f"{self.factor_a_name},{ss['A']:.6f},{df['A']},{ms['A']:.6f},{f['A']:.6f},{p['A']:.6f}")
-        lines.append(f"{self.factor_b_name},{ss['B']:.6f},{df['B']},{ms['B']:.6f},{f['B']:.6f},{p['B']:.6f}")
-        lines.append(f"Interaction,{ss['AB']:.6f},{df['AB']},{ms['AB']:.6f},{f['AB']:.6f},{p['AB']:.6f}")
-        lines.append(f"Error,{ss['error']:.6f},{df['error']},{ms['error']:.6f},-,-")
-        lines.append(f"Total,{ss['total']:.6f},{df['total']},-,-,-")
-        return "\n".join(lines)
+        writer = csv.writer(fileobj, lineterminator="\n")
+        writer.writerow(("Source", "SS", "df", "MS", "F", "p-value"))
+        for label, key in ((self.factor_a_name, "A"),
+                           (self.factor_b_name, "B"),
+                           ("Interaction", "AB")):
+            writer.writerow((
+                label, f"{ss[key]:.6f}", df[key], f"{ms[key]:.6f}",
+                f"{f[key]:.6f}", f"{p[key]:.6f}",
+            ))
+        writer.writerow(("Error", f"{ss['error']:.6f}", df["error"],
+                         f"{ms['error']:.6f}", "-", "-"))
+        writer.writerow(("Total", f"{ss['total']:.6f}", df["total"],
+                         "-", "-", "-"))
+
+    def to_csv_string(self):
+        """Return the ANOVA table as a CSV-formatted string for saving."""
+        buf = io.StringIO()
+        self.write_csv(buf)
+        return buf.getvalue().rstrip("\n")
 
     def _format_summary(self, ss_a, ss_b, ss_ab, ss_e, ss_t,
                         df_a, df_b, df_ab, df_e, df_t,
@@ -164,31 +330,15 @@ class TwoWayANOVA:
                         f_a, f_b, f_ab,
                         p_a, p_b, p_ab):
         """Format the ANOVA table as a readable string."""
-
-        def sig(p):
-            if p < 0.001:
-                return " ***"
-            elif p < 0.01:
-                return " **"
-            elif p < 0.05:
-                return " *"
-            return ""
-
-        header = (
-            f"{'Source':<20} | {'SS':<12} | {'df':<5} | "
-            f"{'MS':<12} | {'F':<10} | {'p-value'}"
-        )
-        sep = "-" * 82
-
         rows = [
             f"{self.factor_a_name:<20} | {ss_a:<12.4f} | {df_a:<5} | "
-            f"{ms_a:<12.4f} | {f_a:<10.4f} | {p_a:.6f}{sig(p_a)}",
+            f"{ms_a:<12.4f} | {f_a:<10.4f} | {p_a:.6f}{_sig(p_a)}",
 
             f"{self.factor_b_name:<20} | {ss_b:<12.4f} | {df_b:<5} | "
-            f"{ms_b:<12.4f} | {f_b:<10.4f} | {p_b:.6f}{sig(p_b)}",
+            f"{ms_b:<12.4f} | {f_b:<10.4f} | {p_b:.6f}{_sig(p_b)}",
 
             f"{'Interaction':<20} | {ss_ab:<12.4f} | {df_ab:<5} | "
-            f"{ms_ab:<12.4f} | {f_ab:<10.4f} | {p_ab:.6f}{sig(p_ab)}",
+            f"{ms_ab:<12.4f} | {f_ab:<10.4f} | {p_ab:.6f}{_sig(p_ab)}",
 
             f"{'Error':<20} | {ss_e:<12.4f} | {df_e:<5} | "
             f"{ms_e:<12.4f} | {'-':<10} | -",
@@ -197,8 +347,10 @@ class TwoWayANOVA:
             f"{'-':<12} | {'-':<10} | -",
         ]
 
-        footer = "\nSignificance: * p<0.05, ** p<0.01, *** p<0.001"
-        return f"{header}\n{sep}\n" + "\n".join(rows) + footer
+        return (
+            f"{_SUMMARY_HEADER}\n{_SUMMARY_SEP}\n" + "\n".join(rows)
+            + _SUMMARY_FOOTER
+        )
 
 
 if __name__ == "__main__":
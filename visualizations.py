@@ -3,19 +3,48 @@ Visualization helpers for ANOVA results.
 
 Every function returns a ``matplotlib.figure.Figure`` so the GUI can embed
 it in a ``FigureCanvasQTAgg`` widget without calling ``plt.show()``.
+Figures are created directly rather than through ``pyplot``, so no
+backend or figure manager is involved until the GUI attaches a canvas.
 """
 
 import numpy as np
 import matplotlib
-matplotlib.use("Agg")  # non-interactive backend; GUI will use Qt backend
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from scipy import stats
 
 
+def _prepare_figure(fig, figsize):
+    """Return *fig* cleared for reuse, or a new Figure of *figsize*."""
+    if fig is None:
+        return Figure(figsize=figsize)
+    fig.clf()
+    return fig
+
+
+def _hist_bins(sorted_values):
+    """
+    Bin count for a histogram of already-sorted, non-empty data.
+
+    Approximates numpy's ``bins="auto"``: the larger of the Sturges and
+    Freedman–Diaconis counts, with FD capped at 2·sqrt(n) bins, read off
+    the sorted array instead of re-scanning and partitioning it.  The
+    quartiles are taken by index rather than interpolated, so the count
+    can differ from numpy's by a bin or so.
+    """
+    n = sorted_values.size
+    span = sorted_values[-1] - sorted_values[0]
+    if span <= 0:
+        return 1
+    sturges = np.log2(n) + 1.0
+    iqr = sorted_values[(3 * n) // 4] - sorted_values[n // 4]
+    fd = span * np.cbrt(n) / (2.0 * iqr) if iqr > 0 else np.inf
+    return int(np.ceil(max(sturges, min(fd, 2.0 * np.sqrt(n)))))
+
+
 # ======================================================================
 # Box Plot
 # ======================================================================
-def box_plot(groups, group_names, title="Box Plot by Group"):
+def box_plot(groups, group_names, title="Box Plot by Group", fig=None):
     """
     Create a box plot for each group.
 
@@ -23,17 +52,22 @@ def box_plot(groups, group_names, title="Box Plot by Group"):
         groups: list of array-like.
         group_names: list of str.
         title: plot title.
+        fig: optional existing Figure to clear and draw into.
 
     Returns:
         matplotlib.figure.Figure
     """
-    fig, ax = plt.subplots(figsize=(7, 4))
-    bp = ax.boxplot(
-        [np.asarray(g) for g in groups],
-        patch_artist=True,
-        labels=group_names,
-    )
-    colors = plt.cm.Set2(np.linspace(0, 1, len(groups)))
+    fig = _prepare_figure(fig, (7, 4))
+    ax = fig.subplots()
+    arrays = [np.asarray(g, dtype=float) for g in groups]
+    if len({a.size for a in arrays}) == 1:
+        # Equal-sized groups (e.g. the two-way factor levels): compute the
+        # box statistics for all groups in one percentile pass
+        bp = ax.bxp(_box_stats(np.column_stack(arrays)), patch_artist=True)
+    else:
+        bp = ax.boxplot(arrays, patch_artist=True)
+    ax.set_xticks(np.arange(1, len(groups) + 1), group_names)
+    colors = matplotlib.colormaps["Set2"](np.linspace(0, 1, len(groups)))
     for patch, color in zip(bp["boxes"], colors):
         patch.set_facecolor(color)
 
@@ -44,11 +78,45 @@ def box_plot(groups, group_names, title="Box Plot by Group"):
     return fig
 
 
+def _box_stats(columns, whis=1.5):
+    """
+    Box-plot statistics for each column of a 2-D array.
+
+    Equivalent to ``matplotlib.cbook.boxplot_stats`` with the default
+    1.5·IQR whiskers, but with the quartiles of every column taken in a
+    single ``np.percentile(..., axis=0)`` call.  Returns the list of
+    dicts ``Axes.bxp`` expects.
+    """
+    q1, med, q3 = np.percentile(columns, [25, 50, 75], axis=0)
+    iqr = q3 - q1
+    lo_lim = q1 - whis * iqr
+    hi_lim = q3 + whis * iqr
+
+    # Whiskers reach the most extreme data inside the limits; if nothing
+    # is inside (only possible with degenerate quartiles) fall back to
+    # the box edge, as matplotlib does
+    inside_hi = np.where(columns <= hi_lim, columns, -np.inf).max(axis=0)
+    inside_lo = np.where(columns >= lo_lim, columns, np.inf).min(axis=0)
+    whishi = np.where(np.isfinite(inside_hi), np.maximum(inside_hi, q3), q3)
+    whislo = np.where(np.isfinite(inside_lo), np.minimum(inside_lo, q1), q1)
+    outside = (columns < whislo) | (columns > whishi)
+
+    return [
+        {
+            "med": med[i], "q1": q1[i], "q3": q3[i],
+            "whislo": whislo[i], "whishi": whishi[i],
+            "fliers": columns[outside[:, i], i],
+            "mean": columns[:, i].mean(),
+        }
+        for i in range(columns.shape[1])
+    ]
+
+
 # ======================================================================
 # Bar Chart with Error Bars
 # ======================================================================
 def bar_chart_with_error(group_means, group_se, group_names,
-                         title="Group Means ± SE"):
+                         title="Group Means ± SE", fig=None):
     """
     Bar chart of group means with standard-error whiskers.
 
@@ -57,13 +125,15 @@ def bar_chart_with_error(group_means, group_se, group_names,
         group_se: list of float (standard errors).
         group_names: list of str.
         title: plot title.
+        fig: optional existing Figure to clear and draw into.
 
     Returns:
         matplotlib.figure.Figure
     """
-    fig, ax = plt.subplots(figsize=(7, 4))
+    fig = _prepare_figure(fig, (7, 4))
+    ax = fig.subplots()
     x = np.arange(len(group_means))
-    colors = plt.cm.Set2(np.linspace(0, 1, len(group_means)))
+    colors = matplotlib.colormaps["Set2"](np.linspace(0, 1, len(group_means)))
 
     ax.bar(x, group_means, yerr=group_se, capsize=5, color=colors, edgecolor="black")
     ax.set_xticks(x)
@@ -80,7 +150,7 @@ def bar_chart_with_error(group_means, group_se, group_names,
 # ======================================================================
 def interaction_plot(cell_means, factor_a_names, factor_b_names,
                      factor_a_label="Factor A", factor_b_label="Factor B",
-                     title="Interaction Plot"):
+                     title="Interaction Plot", fig=None):
     """
     Line plot of cell means: one line per Factor A level, x-axis = Factor B.
 
@@ -91,15 +161,17 @@ def interaction_plot(cell_means, factor_a_names, factor_b_names,
         factor_a_label: axis label for legend.
         factor_b_label: axis label for x-axis.
         title: plot title.
+        fig: optional existing Figure to clear and draw into.
 
     Returns:
         matplotlib.figure.Figure
     """
     cell_means = np.asarray(cell_means)
-    fig, ax = plt.subplots(figsize=(7, 4))
+    fig = _prepare_figure(fig, (7, 4))
+    ax = fig.subplots()
     x = np.arange(cell_means.shape[1])
     markers = ["o", "s", "^", "D", "v", "p", "*", "h"]
-    colors = plt.cm.tab10(np.linspace(0, 1, cell_means.shape[0]))
+    colors = matplotlib.colormaps["tab10"](np.linspace(0, 1, cell_means.shape[0]))
 
     for i in range(cell_means.shape[0]):
         marker = markers[i % len(markers)]
@@ -120,19 +192,21 @@ def interaction_plot(cell_means, factor_a_names, factor_b_names,
 # ======================================================================
 # Residual Plots (Q-Q + histogram)
 # ======================================================================
-def residual_plots(residuals, title_prefix="Residuals"):
+def residual_plots(residuals, title_prefix="Residuals", fig=None):
     """
     Side-by-side Q-Q plot and histogram of residuals.
 
     Args:
         residuals: 1D array of residuals.
         title_prefix: prefix for subplot titles.
+        fig: optional existing Figure to clear and draw into.
 
     Returns:
         matplotlib.figure.Figure
     """
     residuals = np.asarray(residuals)
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 4))
+    fig = _prepare_figure(fig, (10, 4))
+    ax1, ax2 = fig.subplots(1, 2)
 
     # Q-Q plot
     stats.probplot(residuals, dist="norm", plot=ax1)
@@ -140,7 +214,8 @@ def residual_plots(residuals, title_prefix="Residuals"):
     ax1.grid(alpha=0.3)
 
     # Histogram
-    ax2.hist(residuals, bins="auto", color="#5DA5DA", edgecolor="black", alpha=0.8)
+    bins = _hist_bins(np.sort(residuals, axis=None))
+    ax2.hist(residuals, bins=bins, color="#5DA5DA", edgecolor="black", alpha=0.8)
     ax2.set_title(f"{title_prefix} — Histogram", fontweight="bold")
     ax2.set_xlabel("Residual")
     ax2.set_ylabel("Frequency")